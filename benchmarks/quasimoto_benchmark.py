@@ -1,7 +1,7 @@
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
-import numpy as np
 
 # --- CREDITS ---
 # Quasimoto Wave Function Architecture by: QueenFi703
@@ -36,14 +36,13 @@ class QuasimotoWave(nn.Module):
 class SirenLayer(nn.Module):
     def __init__(self, in_f, out_f, w0=30.0, is_first=False):
         super().__init__()
-        self.w0 = w0
+        # Plain float attribute keeps forward TorchScript-friendly
+        self.w0: float = w0
         self.linear = nn.Linear(in_f, out_f)
-        # Special initialization for SIREN
-        with torch.no_grad():
-            if is_first:
-                self.linear.weight.uniform_(-1/in_f, 1/in_f)
-            else:
-                self.linear.weight.uniform_(-np.sqrt(6/in_f)/w0, np.sqrt(6/in_f)/w0)
+        # Special initialization for SIREN: bound precomputed as a Python
+        # float, applied via the fused C++ initializer
+        bound = 1.0 / in_f if is_first else (6.0 / in_f) ** 0.5 / w0
+        nn.init.uniform_(self.linear.weight, -bound, bound)
 
     def forward(self, x):
         return torch.sin(self.w0 * self.linear(x))
@@ -62,10 +61,9 @@ def generate_data():
 
 def train_model(model_name, model, x, t, y, epochs=2000):
     optimizer = optim.Adam(model.parameters(), lr=1e-3)
-    criterion = nn.MSELoss()
     
     for epoch in range(epochs):
-        optimizer.zero_grad()
+        optimizer.zero_grad(set_to_none=True)
         # Handle different input signatures - check if model accepts (x, t) or just (x)
         try:
             # Try (x, t) signature first (for Quasimoto)
@@ -74,7 +72,7 @@ def train_model(model_name, model, x, t, y, epochs=2000):
             # Fall back to (x) signature (for SIREN)
             pred = model(x)
             
-        loss = criterion(pred, y)
+        loss = F.mse_loss(pred, y)
         loss.backward()
         optimizer.step()
         
@@ -93,8 +91,12 @@ if __name__ == "__main__":
             self.waves = nn.ModuleList([QuasimotoWave() for _ in range(n)])
             self.head = nn.Linear(n, 1)
         def forward(self, x, t):
-            # Compute all waves efficiently
-            feats = torch.stack([w(x, t) for w in self.waves], dim=-1)
+            # Write each wave into one preallocated buffer instead of
+            # torch.stack-ing n separate allocations
+            feats = torch.empty((x.shape[0], len(self.waves)),
+                                device=x.device, dtype=x.dtype)
+            for i, w in enumerate(self.waves):
+                feats[:, i] = w(x, t)
             return self.head(feats)
 
     quasimoto_net = QuasimotoEnsemble(n=16)
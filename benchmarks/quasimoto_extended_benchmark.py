@@ -1,15 +1,46 @@
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
 import numpy as np
-import matplotlib.pyplot as plt
 import math
 
+_plt = None
+
+def _get_plt():
+    """Import matplotlib on first use so importing this module (or CLI
+    entry points that never plot) doesn't pay the ~200ms pyplot cost."""
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # non-interactive backend: render straight to file
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
 # --- CREDITS ---
 # Quasimoto Wave Function Architecture by: QueenFi703
 # Extended with RFF baseline, visualization, 4D/6D support, and Interference Basis
 # ----------------
 
+@torch.jit.script
+def _quasimoto_psi(A: torch.Tensor, k: torch.Tensor, omega: torch.Tensor,
+                   v: torch.Tensor, log_sigma: torch.Tensor, phi: torch.Tensor,
+                   epsilon: torch.Tensor, lmbda: torch.Tensor,
+                   x: torch.Tensor, t: torch.Tensor) -> torch.Tensor:
+    """Fused Quasimoto wave expression (single kernel via the TorchScript fuser).
+
+    Real-only version for standard MSE benchmarking. Broadcasts, so it serves
+    both the scalar-parameter QuasimotoWave and the batched SoA ensemble.
+    """
+    # One multiply instead of divide + square: -1/(2 sigma^2) precomputed
+    neg_half_inv_s2 = -0.5 * torch.exp(-2.0 * log_sigma)
+    phase = k * x - omega * t
+    d = x - v * t
+    envelope = torch.exp(neg_half_inv_s2 * (d * d))
+    modulation = torch.sin(phi + epsilon * torch.cos(lmbda * x))
+    return A * torch.cos(phase) * envelope * modulation
+
 class QuasimotoWave(nn.Module):
     """
     Author: QueenFi703
@@ -27,14 +58,40 @@ class QuasimotoWave(nn.Module):
         self.lmbda = nn.Parameter(torch.randn(()))
 
     def forward(self, x, t):
-        sigma = torch.exp(self.log_sigma)
-        phase = self.k * x - self.omega * t
-        envelope = torch.exp(-0.5 * ((x - self.v * t) / sigma) ** 2)
-        modulation = torch.sin(self.phi + self.epsilon * torch.cos(self.lmbda * x))
-        
-        # Real-only version for standard MSE benchmarking
-        psi_real = self.A * torch.cos(phase) * envelope * modulation
-        return psi_real
+        return _quasimoto_psi(self.A, self.k, self.omega, self.v,
+                              self.log_sigma, self.phi, self.epsilon, self.lmbda,
+                              x, t)
+
+@torch.jit.script
+def _quasimoto_psi_4d(A: torch.Tensor, kx: torch.Tensor, ky: torch.Tensor,
+                      kz: torch.Tensor, omega: torch.Tensor, vx: torch.Tensor,
+                      vy: torch.Tensor, vz: torch.Tensor, log_sigma: torch.Tensor,
+                      phi: torch.Tensor, epsilon: torch.Tensor,
+                      lmbda_x: torch.Tensor, lmbda_y: torch.Tensor,
+                      lmbda_z: torch.Tensor, x: torch.Tensor, y: torch.Tensor,
+                      z: torch.Tensor, t: torch.Tensor) -> torch.Tensor:
+    """Fused 4D Quasimoto wave expression: reads x/y/z/t once per forward
+    instead of materializing each envelope/phase/modulation intermediate."""
+    # One multiply instead of divide + square: -1/(2 sigma^2) precomputed
+    neg_half_inv_s2 = -0.5 * torch.exp(-2.0 * log_sigma)
+    phase = kx * x + ky * y + kz * z - omega * t
+    dx = x - vx * t
+    dy = y - vy * t
+    dz = z - vz * t
+    envelope = torch.exp(neg_half_inv_s2 * (dx * dx + dy * dy + dz * dz))
+    modulation = torch.sin(phi + epsilon * torch.cos(lmbda_x * x + lmbda_y * y + lmbda_z * z))
+    return A * torch.cos(phase) * envelope * modulation
+
+@torch.jit.script
+def _psi_from_parts(A: torch.Tensor, phase: torch.Tensor, r2: torch.Tensor,
+                    log_sigma: torch.Tensor, phi: torch.Tensor,
+                    epsilon: torch.Tensor, mod_arg: torch.Tensor) -> torch.Tensor:
+    """Fused tail of the wave expression once phase / squared-distance /
+    modulation argument have been reduced to per-point scalars."""
+    neg_half_inv_s2 = -0.5 * torch.exp(-2.0 * log_sigma)
+    envelope = torch.exp(neg_half_inv_s2 * r2)
+    modulation = torch.sin(phi + epsilon * torch.cos(mod_arg))
+    return A * torch.cos(phase) * envelope * modulation
 
 class QuasimotoWave4D(nn.Module):
     """
@@ -63,21 +120,18 @@ class QuasimotoWave4D(nn.Module):
         self.lmbda_z = nn.Parameter(torch.randn(()))
 
     def forward(self, x, y, z, t):
-        sigma = torch.exp(self.log_sigma)
-        # Phase propagation in 3D space
-        phase = self.kx * x + self.ky * y + self.kz * z - self.omega * t
-        # Gaussian envelope centered on moving point
-        dx = x - self.vx * t
-        dy = y - self.vy * t
-        dz = z - self.vz * t
-        envelope = torch.exp(-0.5 * ((dx**2 + dy**2 + dz**2) / sigma**2))
-        # 3D phase modulation
-        modulation = torch.sin(self.phi + 
-                              self.epsilon * torch.cos(self.lmbda_x * x + 
-                                                       self.lmbda_y * y + 
-                                                       self.lmbda_z * z))
-        psi_real = self.A * torch.cos(phase) * envelope * modulation
-        return psi_real
+        # Stack coordinates once so the two three-term dot products (phase
+        # propagation and modulation argument) each land in one matmul
+        xyz = torch.stack([x, y, z], dim=-1)                          # [N, 3]
+        K = torch.stack([self.kx, self.ky, self.kz])
+        L = torch.stack([self.lmbda_x, self.lmbda_y, self.lmbda_z])
+        V = torch.stack([self.vx, self.vy, self.vz])
+        phase = xyz @ K - self.omega * t
+        mod_arg = xyz @ L
+        d = xyz - t.unsqueeze(-1) * V
+        r2 = (d * d).sum(-1)
+        return _psi_from_parts(self.A, phase, r2, self.log_sigma,
+                               self.phi, self.epsilon, mod_arg)
 
 class QuasimotoWave6D(nn.Module):
     """
@@ -113,7 +167,8 @@ class QuasimotoWave6D(nn.Module):
         self.lmbda_5 = nn.Parameter(torch.randn(()))
 
     def forward(self, x1, x2, x3, x4, x5, t):
-        sigma = torch.exp(self.log_sigma)
+        # One multiply instead of divide + square: -1/(2 sigma^2) precomputed
+        neg_half_inv_s2 = -0.5 * torch.exp(-2.0 * self.log_sigma)
         # Phase propagation in 5D space
         phase = (self.k1 * x1 + self.k2 * x2 + self.k3 * x3 + 
                 self.k4 * x4 + self.k5 * x5 - self.omega * t)
@@ -123,7 +178,7 @@ class QuasimotoWave6D(nn.Module):
         d3 = x3 - self.v3 * t
         d4 = x4 - self.v4 * t
         d5 = x5 - self.v5 * t
-        envelope = torch.exp(-0.5 * ((d1**2 + d2**2 + d3**2 + d4**2 + d5**2) / sigma**2))
+        envelope = torch.exp(neg_half_inv_s2 * (d1**2 + d2**2 + d3**2 + d4**2 + d5**2))
         # 5D phase modulation
         modulation = torch.sin(self.phi + 
                               self.epsilon * torch.cos(self.lmbda_1 * x1 + 
@@ -228,74 +283,173 @@ class RandomFourierFeatures(nn.Module):
         # Fixed random frequencies (not learned)
         self.register_buffer('B', torch.randn(input_dim, num_features) * sigma)
         self.linear = nn.Linear(num_features * 2, 1)  # *2 for sin and cos
-        
+        # Optional cache: B is fixed, so for a stationary input grid the
+        # sin/cos features never change across epochs
+        self._features = None
+
+    def cache_features(self, x):
+        """Precompute the feature map for a fixed input; forward then only
+        runs the linear head until clear_feature_cache() is called."""
+        self._features = None
+        with torch.no_grad():
+            self._features = self._compute_features(x).detach()
+
+    def clear_feature_cache(self):
+        self._features = None
+
     def forward(self, x):
+        if self._features is not None:
+            return self.linear(self._features)
+        return self.linear(self._compute_features(x))
+
+    def _compute_features(self, x):
         # x: [N, input_dim]
         if x.dim() == 1:
             x = x.unsqueeze(-1)
         projections = x @ self.B  # [N, num_features]
-        features = torch.cat([torch.sin(projections), torch.cos(projections)], dim=-1)
-        return self.linear(features)
+        num_features = self.B.shape[1]
+        if projections.requires_grad:
+            # out= writes are illegal inside the autograd graph; keep the cat path
+            features = torch.cat([torch.sin(projections), torch.cos(projections)], dim=-1)
+        else:
+            # Write sin/cos straight into one preallocated buffer — no
+            # intermediate sin/cos tensors and no concat copy
+            features = torch.empty(projections.shape[0], 2 * num_features,
+                                   device=x.device, dtype=x.dtype)
+            torch.sin(projections, out=features[:, :num_features])
+            torch.cos(projections, out=features[:, num_features:])
+        return features
 
 class SirenLayer(nn.Module):
     def __init__(self, in_f, out_f, w0=30.0, is_first=False):
         super().__init__()
-        self.w0 = w0
+        # Plain float attribute keeps forward TorchScript-friendly
+        self.w0: float = w0
         self.linear = nn.Linear(in_f, out_f)
-        # Special initialization for SIREN
-        with torch.no_grad():
-            if is_first:
-                self.linear.weight.uniform_(-1/in_f, 1/in_f)
-            else:
-                self.linear.weight.uniform_(-np.sqrt(6/in_f)/w0, np.sqrt(6/in_f)/w0)
+        # Special initialization for SIREN: bound precomputed as a Python
+        # float, applied via the fused C++ initializer
+        bound = 1.0 / in_f if is_first else (6.0 / in_f) ** 0.5 / w0
+        nn.init.uniform_(self.linear.weight, -bound, bound)
 
     def forward(self, x):
         return torch.sin(self.w0 * self.linear(x))
 
 class QuasimotoEnsemble(nn.Module):
+    """
+    Structure-of-arrays ensemble: all n waves share length-n parameter tensors
+    and are evaluated in a single broadcasted expression. One kernel per op
+    instead of one per wave — removes the Python-level loop and torch.stack.
+    """
     def __init__(self, n=16):
         super().__init__()
-        self.waves = nn.ModuleList([QuasimotoWave() for _ in range(n)])
+        # Same per-wave init as QuasimotoWave, batched along dim 0
+        self.A = nn.Parameter(torch.ones(n))
+        self.k = nn.Parameter(torch.randn(n))
+        self.omega = nn.Parameter(torch.randn(n))
+        self.v = nn.Parameter(torch.randn(n))
+        self.log_sigma = nn.Parameter(torch.zeros(n))
+        self.phi = nn.Parameter(torch.zeros(n))
+        self.epsilon = nn.Parameter(torch.full((n,), 0.1))
+        self.lmbda = nn.Parameter(torch.randn(n))
         self.head = nn.Linear(n, 1)
-    
+
     def forward(self, x, t):
-        # PyTorch optimizes list comprehensions + stack efficiently
-        feats = torch.stack([w(x, t) for w in self.waves], dim=-1)
-        return self.head(feats)
+        # Broadcast [N, 1] inputs against [n] parameters → [N, n] wave outputs
+        x = x.reshape(-1, 1)
+        t = t.reshape(-1, 1)
+        psi = _quasimoto_psi(self.A, self.k, self.omega, self.v,
+                             self.log_sigma, self.phi, self.epsilon, self.lmbda,
+                             x, t)
+        return self.head(psi)
 
 class QuasimotoEnsemble4D(nn.Module):
-    """4D ensemble for spatiotemporal data"""
+    """
+    4D ensemble for spatiotemporal data.
+    Structure-of-arrays layout: all n waves evaluated in one broadcasted pass.
+    """
     def __init__(self, n=8):
         super().__init__()
-        self.waves = nn.ModuleList([QuasimotoWave4D() for _ in range(n)])
+        self.A = nn.Parameter(torch.ones(n))
+        self.kx = nn.Parameter(torch.randn(n))
+        self.ky = nn.Parameter(torch.randn(n))
+        self.kz = nn.Parameter(torch.randn(n))
+        self.omega = nn.Parameter(torch.randn(n))
+        self.vx = nn.Parameter(torch.randn(n))
+        self.vy = nn.Parameter(torch.randn(n))
+        self.vz = nn.Parameter(torch.randn(n))
+        self.log_sigma = nn.Parameter(torch.zeros(n))
+        self.phi = nn.Parameter(torch.zeros(n))
+        self.epsilon = nn.Parameter(torch.full((n,), 0.1))
+        self.lmbda_x = nn.Parameter(torch.randn(n))
+        self.lmbda_y = nn.Parameter(torch.randn(n))
+        self.lmbda_z = nn.Parameter(torch.randn(n))
         self.head = nn.Linear(n, 1)
-    
+
     def forward(self, x, y, z, t):
-        # Optimized: Compute all waves - PyTorch can optimize this
-        feats = torch.stack([w(x, y, z, t) for w in self.waves], dim=-1)
-        return self.head(feats)
+        # Broadcast [N, 1] coordinates against [n] parameters → [N, n]
+        x = x.reshape(-1, 1)
+        y = y.reshape(-1, 1)
+        z = z.reshape(-1, 1)
+        t = t.reshape(-1, 1)
+        psi = _quasimoto_psi_4d(self.A, self.kx, self.ky, self.kz, self.omega,
+                                self.vx, self.vy, self.vz, self.log_sigma,
+                                self.phi, self.epsilon, self.lmbda_x,
+                                self.lmbda_y, self.lmbda_z, x, y, z, t)
+        return self.head(psi)
 
 class QuasimotoEnsemble6D(nn.Module):
-    """6D ensemble for 5D spatial + temporal data"""
+    """
+    6D ensemble for 5D spatial + temporal data.
+    All n waves run in one batched torch.vmap dispatch over stacked per-wave
+    parameters instead of a Python loop + torch.stack.
+    """
     def __init__(self, n=6):
         super().__init__()
-        self.waves = nn.ModuleList([QuasimotoWave6D() for _ in range(n)])
+        # Stack the per-wave parameters along a leading n dim; the stacked
+        # copies become the trainable parameters of the ensemble
+        waves = [QuasimotoWave6D() for _ in range(n)]
+        stacked, _ = torch.func.stack_module_state(waves)
+        self.params = nn.ParameterDict(
+            {name: nn.Parameter(p.detach().clone()) for name, p in stacked.items()}
+        )
+        # Stateless template for functional_call; plain attribute so its own
+        # (unused) parameters stay out of parameters()/state_dict()
+        object.__setattr__(self, '_template', waves[0])
         self.head = nn.Linear(n, 1)
-    
+
     def forward(self, x1, x2, x3, x4, x5, t):
-        # Optimized: Compute all waves - PyTorch can optimize this
-        feats = torch.stack([w(x1, x2, x3, x4, x5, t) for w in self.waves], dim=-1)
-        return self.head(feats)
+        def fmodel(params, x1, x2, x3, x4, x5, t):
+            return torch.func.functional_call(self._template, params,
+                                              (x1, x2, x3, x4, x5, t))
+
+        feats = torch.vmap(fmodel, in_dims=(0, None, None, None, None, None, None))(
+            dict(self.params), x1, x2, x3, x4, x5, t)  # [n, N]
+        return self.head(feats.movedim(0, -1))
 
 # --- BENCHMARK TASK: The "Glitchy Chirp" ---
-def generate_data():
-    x = torch.linspace(-10, 10, 1000).view(-1, 1)
-    t = torch.zeros_like(x)
-    y = torch.sin(0.5 * x**2) * torch.exp(-0.1 * x**2)
-    # The Glitch - positioned at 50-55% of the signal
-    glitch_start = int(0.5 * len(x))
-    glitch_end = int(0.55 * len(x))
-    y[glitch_start:glitch_end] += 0.5 * torch.sin(20 * x[glitch_start:glitch_end])
+@torch.jit.script
+def _signal_1d(x: torch.Tensor) -> torch.Tensor:
+    """Fused chirp signal: one pass through memory instead of one per op."""
+    return torch.sin(0.5 * x * x) * torch.exp(-0.1 * x * x)
+
+@torch.jit.script
+def _signal_4d(X: torch.Tensor, Y: torch.Tensor, Z: torch.Tensor) -> torch.Tensor:
+    """Fused 3D Gaussian-times-oscillation signal for the 4D benchmark."""
+    r2 = X * X + Y * Y + Z * Z
+    return torch.exp(-0.5 * r2) * torch.sin(2 * X) * torch.cos(2 * Y) * torch.sin(2 * Z)
+
+def generate_data(device=None):
+    # Constant data: skip autograd bookkeeping entirely. Passing device
+    # builds the grid in place instead of generating on CPU and copying.
+    with torch.no_grad():
+        x = torch.linspace(-10, 10, 1000, device=device).unsqueeze(-1)
+        t = torch.zeros_like(x)
+        y = _signal_1d(x)
+        # The Glitch - positioned at 50-55% of the signal
+        glitch_start = int(0.5 * len(x))
+        glitch_end = int(0.55 * len(x))
+        xg = x[glitch_start:glitch_end]
+        y[glitch_start:glitch_end] += 0.5 * torch.sin(20 * xg)
     return x, t, y
 
 def generate_4d_data(grid_size=20):
@@ -303,27 +457,24 @@ def generate_4d_data(grid_size=20):
     Generate 4D spatiotemporal data (3D space + time).
     Optimized to reduce intermediate memory allocations.
     """
-    # Create a smaller grid for 4D demo
-    x = torch.linspace(-5, 5, grid_size)
-    y = torch.linspace(-5, 5, grid_size)
-    z = torch.linspace(-5, 5, grid_size)
-    
-    # Create meshgrid - flatten in one step to reduce memory
-    X, Y, Z = torch.meshgrid(x, y, z, indexing='ij')
-    X_flat = X.flatten()
-    Y_flat = Y.flatten()
-    Z_flat = Z.flatten()
-    
-    # Time snapshot
-    t = torch.zeros_like(X_flat)
-    
-    # Generate a 3D Gaussian with some structure - compute in-place where possible
-    # Optimized: Compute signal more efficiently by reusing intermediate results
-    signal = torch.exp(-0.5 * (X_flat**2 + Y_flat**2 + Z_flat**2))
-    signal.mul_(torch.sin(2 * X_flat))
-    signal.mul_(torch.cos(2 * Y_flat))
-    signal.mul_(torch.sin(2 * Z_flat))
-    
+    # Constant data: skip autograd bookkeeping entirely
+    with torch.no_grad():
+        # Create a smaller grid for 4D demo
+        x = torch.linspace(-5, 5, grid_size)
+        y = torch.linspace(-5, 5, grid_size)
+        z = torch.linspace(-5, 5, grid_size)
+
+        # Build the flat coordinate list directly — no full [G, G, G]
+        # meshgrid tensors to materialize and then flatten
+        grid = torch.cartesian_prod(x, y, z)
+        X_flat, Y_flat, Z_flat = grid.unbind(1)
+
+        # Time snapshot
+        t = torch.zeros_like(X_flat)
+
+        # Generate a 3D Gaussian with some structure, fused into one kernel
+        signal = _signal_4d(X_flat, Y_flat, Z_flat)
+
     return X_flat, Y_flat, Z_flat, t, signal.unsqueeze(-1)
 
 def generate_6d_data(grid_size=8):
@@ -335,15 +486,9 @@ def generate_6d_data(grid_size=8):
     # Create 5D grid
     coords = [torch.linspace(-3, 3, grid_size) for _ in range(5)]
     
-    # Create meshgrid for all 5 spatial dimensions
-    grids = torch.meshgrid(*coords, indexing='ij')
-    
-    # Flatten all dimensions - do this in a single pass
-    X1_flat = grids[0].flatten()
-    X2_flat = grids[1].flatten()
-    X3_flat = grids[2].flatten()
-    X4_flat = grids[3].flatten()
-    X5_flat = grids[4].flatten()
+    # Build the flat coordinate list directly — no full 5D meshgrid tensors
+    grid = torch.cartesian_prod(*coords)
+    X1_flat, X2_flat, X3_flat, X4_flat, X5_flat = grid.unbind(1)
     
     # Time snapshot
     t = torch.zeros_like(X1_flat)
@@ -359,59 +504,87 @@ def generate_6d_data(grid_size=8):
     
     return X1_flat, X2_flat, X3_flat, X4_flat, X5_flat, t, signal.unsqueeze(-1)
 
-def train_model(model_name, model, x, t, y, epochs=2000, verbose=True, use_amp=False, grad_clip=None):
+def _make_adam(params, lr=1e-3):
+    """Adam with a batched parameter update: the fused CUDA kernel when
+    available, foreach on CPU. Either way the step is O(1) kernel launches
+    instead of a Python loop over every parameter tensor."""
+    if torch.cuda.is_available():
+        return optim.Adam(params, lr=lr, fused=True)
+    return optim.Adam(params, lr=lr, foreach=True)
+
+def train_model(model_name, model, x, t, y, epochs=2000, verbose=True, use_amp=False, grad_clip=None, use_compile=False):
     """
     Train a model with optional optimizations.
-    
+
     Args:
         model_name: Name of the model for logging
         model: PyTorch model to train
         x, t, y: Training data
         epochs: Number of training epochs
         verbose: Whether to print progress
-        use_amp: Use automatic mixed precision training (faster on compatible GPUs)
+        use_amp: Use bfloat16 autocast for forward/loss (faster on Ampere+ GPUs)
         grad_clip: Optional gradient clipping value to prevent exploding gradients
+        use_compile: Compile the model with torch.compile; one AOT compile,
+            then the same fused forward+backward graph is replayed every epoch
     """
-    optimizer = optim.Adam(model.parameters(), lr=1e-3)
-    criterion = nn.MSELoss()
+    # Move model and data to the accelerator once, outside the epoch loop
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    model.to(device)
+    x, t, y = x.to(device), t.to(device), y.to(device)
+
+    if use_compile and hasattr(torch, "compile"):
+        # Shapes are constant across epochs, so the compiled graph is reused
+        model = torch.compile(model, mode="reduce-overhead")
+
+    optimizer = _make_adam(model.parameters(), lr=1e-3)
     losses = []
-    
-    # Initialize gradient scaler for mixed precision training
-    scaler = torch.cuda.amp.GradScaler() if use_amp and torch.cuda.is_available() else None
-    
-    for epoch in range(epochs):
-        optimizer.zero_grad(set_to_none=True)  # Optimized: set_to_none=True is faster
-        
-        # Handle different input signatures
+
+    # BF16 autocast: parameters stay FP32, no gradient scaler required
+    amp_enabled = use_amp and device.type == "cuda"
+
+    # Resolve squeezes and the forward signature once, not per epoch
+    xs, ts = x.squeeze(), t.squeeze()
+    with torch.no_grad():
         try:
-            # Try (x, t) signature first (for Quasimoto)
-            pred = model(x.squeeze(), t.squeeze()).view(-1, 1)
+            # (x, t) signature (for Quasimoto)
+            model(xs, ts)
+            uses_xt = True
         except TypeError:
-            # Fall back to (x) signature (for SIREN/RFF)
-            pred = model(x)
-            
-        loss = criterion(pred, y)
-        
-        # Optimized backward pass with optional gradient scaling and clipping
-        if scaler is not None:
-            scaler.scale(loss).backward()
-            if grad_clip is not None:
-                scaler.unscale_(optimizer)
-                torch.nn.utils.clip_grad_norm_(model.parameters(), grad_clip)
-            scaler.step(optimizer)
-            scaler.update()
-        else:
-            loss.backward()
-            if grad_clip is not None:
-                torch.nn.utils.clip_grad_norm_(model.parameters(), grad_clip)
-            optimizer.step()
-        
-        losses.append(loss.item())
-        
+            # (x) signature (for SIREN/RFF)
+            uses_xt = False
+    fwd = (lambda: model(xs, ts).view(-1, 1)) if uses_xt else (lambda: model(x))
+
+    # The input grid is fixed for the whole run, so the RFF sin/cos features
+    # are identical every epoch — compute them once (unwrap torch.compile)
+    is_rff = isinstance(getattr(model, "_orig_mod", model), RandomFourierFeatures)
+    if is_rff:
+        model.cache_features(x)
+
+    for epoch in range(epochs):
+        optimizer.zero_grad(set_to_none=True)  # Optimized: set_to_none=True is faster
+
+        with torch.autocast(device_type=device.type, dtype=torch.bfloat16,
+                            enabled=amp_enabled):
+            pred = fwd()
+            loss = F.mse_loss(pred, y)
+
+        loss.backward()
+        if grad_clip is not None:
+            torch.nn.utils.clip_grad_norm_(model.parameters(), grad_clip)
+        optimizer.step()
+
+        # Keep losses on-device; syncing via .item() every epoch stalls the stream
+        losses.append(loss.detach())
+
         if verbose and epoch % 500 == 0:
             print(f"[{model_name}] Epoch {epoch} Loss: {loss.item():.6f}")
-    
-    return loss.item(), losses
+
+    if is_rff:
+        model.clear_feature_cache()
+
+    # Single device→host transfer for the whole loss history
+    losses = torch.stack(losses).cpu().tolist()
+    return losses[-1], losses
 
 def train_model_4d(model_name, model, x, y_coord, z, t, signal, epochs=1000, verbose=True, grad_clip=None):
     """
@@ -420,14 +593,19 @@ def train_model_4d(model_name, model, x, y_coord, z, t, signal, epochs=1000, ver
     Args:
         grad_clip: Optional gradient clipping value to prevent exploding gradients
     """
-    optimizer = optim.Adam(model.parameters(), lr=1e-3)
-    criterion = nn.MSELoss()
+    # Move model and data to the accelerator once, outside the epoch loop
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    model.to(device)
+    x, y_coord, z = x.to(device), y_coord.to(device), z.to(device)
+    t, signal = t.to(device), signal.to(device)
+
+    optimizer = _make_adam(model.parameters(), lr=1e-3)
     losses = []
-    
+
     for epoch in range(epochs):
         optimizer.zero_grad(set_to_none=True)  # Optimized: set_to_none=True is faster
         pred = model(x, y_coord, z, t).view(-1, 1)
-        loss = criterion(pred, signal)
+        loss = F.mse_loss(pred, signal)
         loss.backward()
         
         # Optimized: Optional gradient clipping
@@ -435,12 +613,15 @@ def train_model_4d(model_name, model, x, y_coord, z, t, signal, epochs=1000, ver
             torch.nn.utils.clip_grad_norm_(model.parameters(), grad_clip)
         
         optimizer.step()
-        losses.append(loss.item())
-        
+        # Keep losses on-device; syncing via .item() every epoch stalls the stream
+        losses.append(loss.detach())
+
         if verbose and epoch % 200 == 0:
             print(f"[{model_name}] Epoch {epoch} Loss: {loss.item():.6f}")
-    
-    return loss.item(), losses
+
+    # Single device→host transfer for the whole loss history
+    losses = torch.stack(losses).cpu().tolist()
+    return losses[-1], losses
 
 def train_model_6d(model_name, model, x1, x2, x3, x4, x5, t, signal, epochs=500, verbose=True, grad_clip=None):
     """
@@ -449,14 +630,20 @@ def train_model_6d(model_name, model, x1, x2, x3, x4, x5, t, signal, epochs=500,
     Args:
         grad_clip: Optional gradient clipping value to prevent exploding gradients
     """
-    optimizer = optim.Adam(model.parameters(), lr=1e-3)
-    criterion = nn.MSELoss()
+    # Move model and data to the accelerator once, outside the epoch loop
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    model.to(device)
+    x1, x2, x3 = x1.to(device), x2.to(device), x3.to(device)
+    x4, x5 = x4.to(device), x5.to(device)
+    t, signal = t.to(device), signal.to(device)
+
+    optimizer = _make_adam(model.parameters(), lr=1e-3)
     losses = []
-    
+
     for epoch in range(epochs):
         optimizer.zero_grad(set_to_none=True)  # Optimized: set_to_none=True is faster
         pred = model(x1, x2, x3, x4, x5, t).view(-1, 1)
-        loss = criterion(pred, signal)
+        loss = F.mse_loss(pred, signal)
         loss.backward()
         
         # Optimized: Optional gradient clipping
@@ -464,15 +651,19 @@ def train_model_6d(model_name, model, x1, x2, x3, x4, x5, t, signal, epochs=500,
             torch.nn.utils.clip_grad_norm_(model.parameters(), grad_clip)
         
         optimizer.step()
-        losses.append(loss.item())
-        
+        # Keep losses on-device; syncing via .item() every epoch stalls the stream
+        losses.append(loss.detach())
+
         if verbose and epoch % 100 == 0:
             print(f"[{model_name}] Epoch {epoch} Loss: {loss.item():.6f}")
-    
-    return loss.item(), losses
+
+    # Single device→host transfer for the whole loss history
+    losses = torch.stack(losses).cpu().tolist()
+    return losses[-1], losses
 
 def visualize_predictions(x, y_true, models, model_names, save_path='quasimoto_comparison.png'):
     """Plot true signal vs model predictions"""
+    plt = _get_plt()
     num_plots = len(models) + 1  # +1 for ground truth
     fig, axes = plt.subplots(num_plots, 1, figsize=(14, 3 * num_plots))
     
@@ -480,28 +671,37 @@ def visualize_predictions(x, y_true, models, model_names, save_path='quasimoto_c
     if num_plots == 1:
         axes = [axes]
     
+    # Detach and copy to host once, then reuse across every axis
+    x_np = x.detach().cpu().numpy()
+    y_np = y_true.detach().cpu().numpy()
+
+    # Compute all predictions in one no_grad pass (models may sit on GPU
+    # after training) and transfer the whole stack to host in one copy
+    device = next(models[0].parameters()).device if models else x.device
+    xd = x.to(device)
+    xs = xd.squeeze()
+    zeros = torch.zeros_like(xs)
+    with torch.no_grad():
+        preds = torch.stack([
+            model(xs, zeros).view(-1, 1) if name.startswith("Quasimoto") else model(xd)
+            for model, name in zip(models, model_names)
+        ]).cpu().numpy()
+
     # Plot ground truth
-    axes[0].plot(x.numpy(), y_true.numpy(), 'k-', linewidth=2, label='Ground Truth')
+    axes[0].plot(x_np, y_np, 'k-', linewidth=2, label='Ground Truth')
     axes[0].set_title('Ground Truth Signal', fontsize=14, fontweight='bold')
     axes[0].legend(fontsize=11)
     axes[0].grid(True, alpha=0.3)
     axes[0].set_xlabel('x')
     axes[0].set_ylabel('y')
-    
+
     # Plot predictions
-    for idx, (model, name) in enumerate(zip(models, model_names)):
-        with torch.no_grad():
-            if name.startswith("Quasimoto"):
-                pred = model(x.squeeze(), torch.zeros_like(x.squeeze())).view(-1, 1)
-            else:
-                pred = model(x)
-        
-        # Calculate residual
-        residual = (y_true - pred).numpy()
-        mse = np.mean(residual**2)
-        
-        axes[idx + 1].plot(x.numpy(), y_true.numpy(), 'k--', alpha=0.3, linewidth=1, label='Ground Truth')
-        axes[idx + 1].plot(x.numpy(), pred.numpy(), 'r-', linewidth=2, label=f'{name} Prediction')
+    for idx, name in enumerate(model_names):
+        pred_np = preds[idx]
+        mse = np.mean((y_np - pred_np)**2)
+
+        axes[idx + 1].plot(x_np, y_np, 'k--', alpha=0.3, linewidth=1, label='Ground Truth')
+        axes[idx + 1].plot(x_np, pred_np, 'r-', linewidth=2, label=f'{name} Prediction')
         axes[idx + 1].set_title(f'{name} Fit (MSE: {mse:.8f})', fontsize=14, fontweight='bold')
         axes[idx + 1].legend(fontsize=11)
         axes[idx + 1].grid(True, alpha=0.3)
@@ -509,12 +709,13 @@ def visualize_predictions(x, y_true, models, model_names, save_path='quasimoto_c
         axes[idx + 1].set_ylabel('y')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    plt.savefig(save_path, dpi=150)
     print(f"\n✓ Visualization saved to {save_path}")
     return fig
 
 def visualize_convergence(losses_dict, save_path='quasimoto_convergence.png'):
     """Plot convergence curves for all models"""
+    plt = _get_plt()
     plt.figure(figsize=(12, 6))
     
     for name, losses in losses_dict.items():
@@ -527,11 +728,15 @@ def visualize_convergence(losses_dict, save_path='quasimoto_convergence.png'):
     plt.grid(True, alpha=0.3)
     plt.yscale('log')
     plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    plt.savefig(save_path, dpi=150)
     print(f"✓ Convergence plot saved to {save_path}")
 
 # Execution
 if __name__ == "__main__":
+    # TF32 matmuls on Ampere+ GPUs: ~2x linear-layer throughput at FP32 range
+    torch.set_float32_matmul_precision("high")
+    torch.backends.cuda.matmul.allow_tf32 = True
+
     print("=" * 70)
     print("QUASIMOTO EXTENDED BENCHMARK")
     print("=" * 70)
@@ -602,6 +807,7 @@ if __name__ == "__main__":
     print(f"Quasimoto-4D Final Loss: {final_loss_4d:.8f}")
     
     # Plot 4D convergence
+    plt = _get_plt()
     plt.figure(figsize=(10, 5))
     plt.plot(losses_4d, linewidth=2, color='purple')
     plt.xlabel('Epoch', fontsize=12)
@@ -610,7 +816,7 @@ if __name__ == "__main__":
     plt.grid(True, alpha=0.3)
     plt.yscale('log')
     plt.tight_layout()
-    plt.savefig('quasimoto_4d_convergence.png', dpi=150, bbox_inches='tight')
+    plt.savefig('quasimoto_4d_convergence.png', dpi=150)
     print("✓ 4D convergence plot saved to quasimoto_4d_convergence.png")
     
     print("\n" + "=" * 70)
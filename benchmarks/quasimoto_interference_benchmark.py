@@ -1,5 +1,6 @@
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
 import numpy as np
 import matplotlib
@@ -63,7 +64,6 @@ print(f"✓ SIREN: {siren_params:,} parameters")
 # Training function
 def train_model(model_name, model, x, t, y, epochs=1000):
     optimizer = optim.Adam(model.parameters(), lr=1e-3)
-    criterion = nn.MSELoss()
     losses = []
     
     for epoch in range(epochs):
@@ -78,7 +78,7 @@ def train_model(model_name, model, x, t, y, epochs=1000):
         else:  # SIREN
             pred = model(x)
             
-        loss = criterion(pred, y)
+        loss = F.mse_loss(pred, y)
         loss.backward()
         optimizer.step()
         losses.append(loss.item())
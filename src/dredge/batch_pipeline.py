@@ -152,6 +152,30 @@ class BatchInferencePipeline:
         }
 
 
+def write_results_jsonl(records: List[Dict[str, Any]], stream=None) -> None:
+    """
+    Write per-task results as newline-delimited JSON.
+
+    Serializes every record up front and issues a single buffered write to
+    the binary stream, using orjson when installed.
+
+    Args:
+        records: Result dictionaries to emit
+        stream: Binary stream to write to (default: sys.stdout.buffer)
+    """
+    if stream is None:
+        stream = sys.stdout.buffer
+
+    try:
+        import orjson
+        encode = orjson.dumps
+    except ImportError:
+        encode = lambda record: json.dumps(record).encode()
+
+    stream.write(b"".join(encode(record) + b"\n" for record in records))
+    stream.flush()
+
+
 def generate_test_tasks(count: int, with_repeats: bool = True) -> List[Dict[str, Any]]:
     """
     Generate test tasks for load testing.
@@ -190,14 +214,16 @@ def generate_test_tasks(count: int, with_repeats: bool = True) -> List[Dict[str,
     return tasks
 
 
-def run_load_test(num_tasks: int = 100, num_workers: int = 4, with_cache: bool = True):
+def run_load_test(num_tasks: int = 100, num_workers: int = 4, with_cache: bool = True,
+                  emit_jsonl: bool = False):
     """
     Run a complete load test.
-    
+
     Args:
         num_tasks: Number of tasks to process
         num_workers: Number of parallel workers
         with_cache: Enable caching
+        emit_jsonl: Emit per-task results as newline-delimited JSON on stdout
     """
     print("=" * 70)
     print("DREDGE Batch Unified Inference Load Test")
@@ -254,7 +280,10 @@ def run_load_test(num_tasks: int = 100, num_workers: int = 4, with_cache: bool =
         if cache_result['success']:
             print("\nCache Statistics:")
             print(f"  {json.dumps(cache_result['cache_stats'], indent=4)}")
-    
+
+    if emit_jsonl:
+        write_results_jsonl(result['results'])
+
     return result
 
 
@@ -265,11 +294,14 @@ if __name__ == '__main__':
     parser.add_argument('--tasks', type=int, default=100, help='Number of tasks (default: 100)')
     parser.add_argument('--workers', type=int, default=4, help='Number of workers (default: 4)')
     parser.add_argument('--no-cache', action='store_true', help='Disable caching')
-    
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Emit per-task results as newline-delimited JSON')
+
     args = parser.parse_args()
-    
+
     run_load_test(
         num_tasks=args.tasks,
         num_workers=args.workers,
-        with_cache=not args.no_cache
+        with_cache=not args.no_cache,
+        emit_jsonl=args.jsonl
     )
@@ -8,7 +8,6 @@ import time
 import hashlib
 from pathlib import Path
 from typing import Optional, Dict, Any, Union, List
-from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger("DREDGE.Cache")
@@ -125,8 +124,9 @@ class FileCache(CacheBackend):
     
     def _get_path(self, key: str) -> Path:
         """Get file path for cache key."""
-        # Hash the key to create a safe filename
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        # Hash the key to create a safe filename; a 16-byte blake2b digest
+        # is cheaper than sha256 and plenty for collision-free filenames
+        key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return self.cache_dir / f"{key_hash}.json"
     
     def get(self, key: str) -> Optional[Any]:
@@ -166,9 +166,11 @@ class FileCache(CacheBackend):
                 'key': key  # Store original key for debugging
             }
             
+            # Serialize to one string first; json.dump streams many small
+            # writes through the file object, which is slower
             with open(path, 'w') as f:
-                json.dump(entry, f)
-            
+                f.write(json.dumps(entry))
+
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)" if ttl else f"Cache set: {key}")
             return True
         except (IOError, json.JSONEncodeError, TypeError) as e:
@@ -229,8 +231,10 @@ class ResultCache:
         """Create cache key from prefix and parameters."""
         # Sort params for consistent keys
         param_str = json.dumps(params, sort_keys=True)
-        key_hash = hashlib.sha256(param_str.encode()).hexdigest()
-        return f"{prefix}:{key_hash[:16]}"
+        # blake2b with an 8-byte digest yields the same 16 hex chars as the
+        # truncated sha256 did, without hashing more than we keep
+        key_hash = hashlib.blake2b(param_str.encode(), digest_size=8).hexdigest()
+        return f"{prefix}:{key_hash}"
     
     def get_spectrum(self, max_modes: int, dimensions: int) -> Optional[Dict[str, Any]]:
         """Get cached string spectrum."""
@@ -3,15 +3,26 @@ import os
 import platform
 import shutil
 import sys
-import json
-from pathlib import Path
 from . import __version__
-from .health import get_system_info, format_system_info, check_health, validate_server_config
-from .config import load_config, save_config, init_config, get_config_path, DEFAULT_CONFIG
+
+# json and the .health/.config helpers are imported lazily inside the
+# command branches so trivial invocations (--version, --help) stay cheap
+
+
+def _json_dumps(data) -> str:
+    """Render data as pretty-printed JSON, preferring orjson when installed."""
+    try:
+        import orjson
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2)
 
 
 def _merge_server_args(args, config_key: str, default_host: str, default_port: int):
     """Merge CLI arguments with configuration for server commands."""
+    from .config import load_config
+
     config = load_config()
     server_config = config.get(config_key, {})
     
@@ -44,8 +55,20 @@ class MobileHelpFormatter(argparse.HelpFormatter):
         super().__init__(prog, width=width, max_help_position=24, **kwargs)
 
 
-def main(argv=None):
-    ctx = _detect_mobile_context()
+# Static option tables, hoisted so parser construction does not rebuild them
+_DEVICE_CHOICES = ("auto", "cpu", "cuda", "mps")
+
+# Cached (term_width, is_mobile, parser, config_parser) from the last build;
+# repeated main() calls in one process reuse the argparse tree
+_parser_cache = None
+
+
+def _build_parser(ctx):
+    """Build (or reuse) the argparse tree for the detected context."""
+    global _parser_cache
+    if _parser_cache is not None and _parser_cache[:2] == (ctx["term_width"], ctx["is_mobile"]):
+        return _parser_cache[2], _parser_cache[3]
+
     formatter = lambda prog: MobileHelpFormatter(prog, width=ctx["term_width"])
     parser = argparse.ArgumentParser(
         prog="dredge",
@@ -121,7 +144,7 @@ def main(argv=None):
     )
     mcp_parser.add_argument(
         "--device",
-        choices=["auto", "cpu", "cuda", "mps"],
+        choices=_DEVICE_CHOICES,
         default="auto",
         help="Device to use for computation (default: auto-detect)"
     )
@@ -156,7 +179,24 @@ def main(argv=None):
     config_path_parser = config_subparsers.add_parser(
         "path", help="Show configuration file path", formatter_class=formatter
     )
-    
+
+    _parser_cache = (ctx["term_width"], ctx["is_mobile"], parser, config_parser)
+    return parser, config_parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast path: the common `dredge --version` invocation answers without
+    # paying for terminal detection or the full argparse tree
+    if argv == ["--version"]:
+        print(__version__)
+        return 0
+
+    ctx = _detect_mobile_context()
+    parser, config_parser = _build_parser(ctx)
+
     args = parser.parse_args(argv)
     
     if args.version:
@@ -164,43 +204,58 @@ def main(argv=None):
         return 0
     
     if args.version_info:
+        from .health import get_system_info, format_system_info
+
         print(f"DREDGE version {__version__}")
         print()
         sys_info = get_system_info()
         print(format_system_info(sys_info))
         return 0
-    
+
     if args.command == "health":
+        from .health import check_health
+
         health = check_health()
         if args.json:
-            print(json.dumps(health, indent=2))
+            print(_json_dumps(health))
         else:
-            print(f"Health Status: {health['status']}")
-            print()
-            print("Dependency Checks:")
+            # Collect the report and flush it in one write rather than a
+            # print call per line
+            lines = [
+                f"Health Status: {health['status']}",
+                "",
+                "Dependency Checks:",
+            ]
             for dep, available in health['checks']['dependencies'].items():
                 status = "✓" if available else "✗"
-                print(f"  {status} {dep}")
-            
-            if 'missing_dependencies' in health and health['missing_dependencies']:
-                print()
-                print("Missing dependencies:")
-                for dep in health['missing_dependencies']:
-                    print(f"  - {dep}")
-                print()
-                print("Run 'make install-python' or 'pip install -r requirements.txt' to install")
+                lines.append(f"  {status} {dep}")
+
+            missing = health.get('missing_dependencies')
+            if missing:
+                lines.append("")
+                lines.append("Missing dependencies:")
+                lines.extend(f"  - {dep}" for dep in missing)
+                lines.append("")
+                lines.append("Run 'make install-python' or 'pip install -r requirements.txt' to install")
+                sys.stdout.write("\n".join(lines) + "\n")
                 return 1
+
+            sys.stdout.write("\n".join(lines) + "\n")
         return 0 if health['status'] == 'healthy' else 1
     
     if args.command == "info":
+        from .health import get_system_info, format_system_info
+
         sys_info = get_system_info()
         print(format_system_info(sys_info))
         return 0
-    
+
     if args.command == "config":
+        from .config import load_config, init_config, get_config_path
+
         if args.config_action == "show":
             config = load_config()
-            print(json.dumps(config, indent=2))
+            print(_json_dumps(config))
             return 0
         elif args.config_action == "init":
             try:
@@ -223,9 +278,11 @@ def main(argv=None):
             return 0
     
     if args.command == "serve":
+        from .health import validate_server_config
+
         # Load config and merge with CLI args
         host, port, debug, _ = _merge_server_args(args, "server", "0.0.0.0", 3001)
-        
+
         try:
             validate_server_config(host, port, debug)
         except ValueError as e:
@@ -237,10 +294,12 @@ def main(argv=None):
         return 0
     
     if args.command == "mcp":
+        from .health import validate_server_config
+
         # Load config and merge with CLI args
         host, port, debug, mcp_config = _merge_server_args(args, "mcp", "0.0.0.0", 3002)
         device = args.device if args.device != "auto" else mcp_config.get("device", "auto")
-        
+
         try:
             validate_server_config(host, port, debug)
         except ValueError as e:
@@ -44,13 +44,23 @@ def get_config_path() -> Path:
     return local_config
 
 
+# Cached merged configuration; load_config re-reads the file at most once
+# per process, and save_config invalidates the cache
+_config_cache: Optional[Dict[str, Any]] = None
+
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from file or return defaults."""
+    global _config_cache
+    if _config_cache is not None:
+        return dict(_config_cache)
+
     config_path = get_config_path()
-    
+
     if not config_path.exists():
-        return DEFAULT_CONFIG.copy()
-    
+        _config_cache = DEFAULT_CONFIG.copy()
+        return dict(_config_cache)
+
     try:
         with open(config_path, 'r') as f:
             user_config = json.load(f)
@@ -62,8 +72,9 @@ def load_config() -> Dict[str, Any]:
                 config[key].update(user_config[key])
             else:
                 config[key] = user_config[key]
-        
-        return config
+
+        _config_cache = config
+        return dict(_config_cache)
     except (json.JSONDecodeError, IOError) as e:
         print(f"Warning: Failed to load config from {config_path}: {e}")
         return DEFAULT_CONFIG.copy()
@@ -71,11 +82,17 @@ def load_config() -> Dict[str, Any]:
 
 def save_config(config: Dict[str, Any], path: Optional[Path] = None) -> None:
     """Save configuration to file."""
+    global _config_cache
     if path is None:
         path = get_config_path()
-    
+
+    # Serialize first so the file is written in a single call instead of
+    # the many small writes json.dump issues
     with open(path, 'w') as f:
-        json.dump(config, f, indent=2)
+        f.write(json.dumps(config, indent=2))
+
+    # Written config may differ from what was cached
+    _config_cache = None
 
 
 def init_config(path: Optional[Path] = None) -> Path:
@@ -1,10 +1,14 @@
 """
 Health check and system information utilities for DREDGE.
 """
+import errno
+import importlib
 import sys
 import os
 import platform
 import shutil
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 
@@ -48,39 +52,23 @@ def get_system_info() -> Dict[str, Any]:
     }
 
 
-def check_dependencies() -> Dict[str, bool]:
-    """Check if required dependencies are installed."""
-    checks = {}
-    
-    # Check Flask
-    try:
-        import flask
-        checks["flask"] = True
-    except ImportError:
-        checks["flask"] = False
-    
-    # Check PyTorch
-    try:
-        import torch
-        checks["torch"] = True
-    except ImportError:
-        checks["torch"] = False
-    
-    # Check NumPy
-    try:
-        import numpy
-        checks["numpy"] = True
-    except ImportError:
-        checks["numpy"] = False
-    
-    # Check matplotlib
+def _check_import(module: str) -> bool:
+    """Check whether a module can be imported."""
     try:
-        import matplotlib
-        checks["matplotlib"] = True
+        importlib.import_module(module)
+        return True
     except ImportError:
-        checks["matplotlib"] = False
-    
-    return checks
+        return False
+
+
+def check_dependencies() -> Dict[str, bool]:
+    """Check if required dependencies are installed."""
+    # The checks are independent, so run them in parallel; per-module
+    # import locks let the disk-bound first imports overlap
+    modules = ["flask", "torch", "numpy", "matplotlib"]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = pool.map(_check_import, modules)
+    return dict(zip(modules, results))
 
 
 def format_system_info(info: Dict[str, Any]) -> str:
@@ -105,6 +93,22 @@ def format_system_info(info: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _port_in_use(host: str, port: int) -> bool:
+    """Check whether a local port is already bound.
+
+    A bind attempt with SO_REUSEADDR answers immediately, unlike a
+    connect probe which can hang for its full timeout.
+    """
+    probe_host = "127.0.0.1" if host == "0.0.0.0" else host
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((probe_host, port))
+    except OSError as e:
+        return e.errno == errno.EADDRINUSE
+    return False
+
+
 def validate_server_config(host: str, port: int, debug: bool) -> None:
     """Validate server configuration and provide helpful error messages."""
     # Check port range
@@ -125,6 +129,10 @@ def validate_server_config(host: str, port: int, debug: bool) -> None:
     }
     if port in common_ports:
         print(f"Note: Port {port} is commonly used by {common_ports[port]}", file=sys.stderr)
+
+    # Check whether something is already listening on the port
+    if _port_in_use(host, port):
+        print(f"Warning: Port {port} appears to be in use already", file=sys.stderr)
     
     # Validate host
     if host not in ["0.0.0.0", "localhost", "127.0.0.1"] and not host.startswith("192.168."):
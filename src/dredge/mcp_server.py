@@ -55,6 +55,33 @@ from .string_theory import (
 )
 
 
+# Static capability table, built once at import; list_capabilities only
+# fills in the per-call device and feature information
+_SERVER_CAPABILITIES = {
+    "models": {
+        "quasimoto_1d": "1D wave function (8 parameters)",
+        "quasimoto_4d": "4D spatiotemporal wave function (13 parameters)",
+        "quasimoto_6d": "6D high-dimensional wave function (17 parameters)",
+        "quasimoto_ensemble": "Ensemble of wave functions (configurable)",
+        "string_theory": "String theory neural network (configurable dimensions, depth, GPU)"
+    },
+    "operations": [
+        "load_model",
+        "inference",
+        "get_parameters",
+        "benchmark",
+        "string_spectrum",
+        "string_parameters",
+        "unified_inference",
+        "get_metrics",
+        "get_cache_stats",
+        "get_dependabot_alerts",
+        "explain_dependabot_alert",
+        "update_dependabot_alert"
+    ]
+}
+
+
 class QuasimotoMCPServer:
     """
     MCP Server for Quasimoto neural wave function models.
@@ -67,7 +94,6 @@ class QuasimotoMCPServer:
         self.logger = get_logger("MCPServer")
 
         # Determine device from parameter, env var, or auto-detect
-        import os
         if device == 'auto':
             device = os.getenv('DEVICE', 'auto')
 
@@ -129,29 +155,7 @@ class QuasimotoMCPServer:
             "name": "DREDGE Quasimoto String Theory MCP Server",
             "version": __version__,
             "protocol": "Model Context Protocol v1.0",
-            "capabilities": {
-                "models": {
-                    "quasimoto_1d": "1D wave function (8 parameters)",
-                    "quasimoto_4d": "4D spatiotemporal wave function (13 parameters)",
-                    "quasimoto_6d": "6D high-dimensional wave function (17 parameters)",
-                    "quasimoto_ensemble": "Ensemble of wave functions (configurable)",
-                    "string_theory": "String theory neural network (configurable dimensions, depth, GPU)"
-                },
-                "operations": [
-                    "load_model",
-                    "inference",
-                    "get_parameters",
-                    "benchmark",
-                    "string_spectrum",
-                    "string_parameters",
-                    "unified_inference",
-                    "get_metrics",
-                    "get_cache_stats",
-                    "get_dependabot_alerts",
-                    "explain_dependabot_alert",
-                    "update_dependabot_alert"
-                ]
-            },
+            "capabilities": _SERVER_CAPABILITIES,
             "features": {
                 "caching": self.use_cache,
                 "metrics": self.enable_metrics,
@@ -2,13 +2,11 @@
 DREDGE Monitoring and Metrics
 Provides metrics collection, exporters, and distributed tracing support.
 """
+import itertools
 import time
 import logging
-import uuid
 from typing import Dict, Any, Optional, List
 from collections import defaultdict, deque
-from datetime import datetime
-import json
 
 logger = logging.getLogger("DREDGE.Monitoring")
 
@@ -146,9 +144,14 @@ class Timer:
         return False
 
 
+# Span IDs only need process-local uniqueness; read the clock once at
+# import and hand out increments instead of generating a UUID per span
+_span_id_counter = itertools.count(time.time_ns())
+
+
 class TraceSpan:
     """Represents a trace span for distributed tracing."""
-    
+
     def __init__(self, name: str, trace_id: Optional[str] = None, parent_id: Optional[str] = None):
         self.name = name
         self.trace_id = trace_id or self._generate_id()
@@ -160,8 +163,8 @@ class TraceSpan:
         self.logs: List[Dict[str, Any]] = []
     
     def _generate_id(self) -> str:
-        """Generate a unique ID for trace/span using UUID."""
-        return str(uuid.uuid4().hex)[:16]
+        """Generate a unique ID for trace/span from the seeded counter."""
+        return f"{next(_span_id_counter):016x}"
     
     def set_tag(self, key: str, value: Any):
         """Set a tag on the span."""
@@ -3,6 +3,7 @@ DREDGE x Dolly Server
 A lightweight web server for the DREDGE x Dolly integration.
 """
 import hashlib
+import json
 import os
 import logging
 from functools import lru_cache
@@ -41,6 +42,25 @@ def _compute_insight_hash(insight_text: str) -> str:
     return hashlib.sha256(insight_text.encode()).hexdigest()
 
 
+# Root endpoint payload is fully deterministic, so build it once at import
+# instead of on every request
+_API_INFO = {
+    "name": "DREDGE x Dolly",
+    "version": __version__,
+    "description": "GPU-CPU Lifter · Save · Files · Print",
+    "endpoints": {
+        "/": "API information",
+        "/health": "Health check",
+        "/lift": "Lift an insight (POST)",
+        "/quasimoto-gpu": "Quasimoto GPU visualization",
+    }
+}
+
+# Second cache layer: the rendered JSON body never changes either, so
+# serialize it once and skip jsonify on the request path
+_API_INFO_JSON = json.dumps(_API_INFO)
+
+
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
@@ -48,17 +68,7 @@ def create_app():
     @app.route('/')
     def index():
         """Root endpoint with API information."""
-        return jsonify({
-            "name": "DREDGE x Dolly",
-            "version": __version__,
-            "description": "GPU-CPU Lifter · Save · Files · Print",
-            "endpoints": {
-                "/": "API information",
-                "/health": "Health check",
-                "/lift": "Lift an insight (POST)",
-                "/quasimoto-gpu": "Quasimoto GPU visualization",
-            }
-        })
+        return app.response_class(_API_INFO_JSON, mimetype='application/json')
     
     @app.route('/health')
     def health():
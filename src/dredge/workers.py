@@ -2,14 +2,13 @@
 DREDGE Distributed Workers and Queue Infrastructure
 Provides scale-out capabilities with task queues and worker processes.
 """
-import json
+import itertools
+import os
 import time
 import logging
-import uuid
 from typing import Dict, Any, Optional, Callable, List
 from queue import Queue, Empty
 from threading import Thread, Event
-import hashlib
 
 logger = logging.getLogger("DREDGE.Workers")
 
@@ -58,6 +57,10 @@ class TaskQueue:
         """
         self._queue = Queue(maxsize=maxsize)
         self._results: Dict[str, Task] = {}
+        # Draw entropy once per queue; per-task IDs then come from a cheap
+        # monotonic counter (itertools.count is atomic under the GIL)
+        self._id_prefix = os.urandom(4).hex()
+        self._id_counter = itertools.count()
         self._stats = {
             'tasks_submitted': 0,
             'tasks_completed': 0,
@@ -79,9 +82,7 @@ class TaskQueue:
             Task ID
         """
         if not task_id:
-            # Generate cryptographically secure task ID
-            unique_part = uuid.uuid4().hex[:12]
-            task_id = f"{operation}_{unique_part}"
+            task_id = f"{operation}_{self._id_prefix}{next(self._id_counter):04x}"
         
         task = Task(task_id, operation, params)
         self._queue.put(task)
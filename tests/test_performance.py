@@ -106,6 +106,33 @@ def test_server_hash_caching():
     assert time_with_cache < time_no_cache * 0.5, "Cached version should be at least 2x faster"
 
 
+def test_lift_endpoint_performance():
+    """Test that repeated lift requests stay fast for the same insight."""
+    from dredge.server import create_app
+
+    app = create_app()
+    client = app.test_client()
+
+    # Serialize the payload once, outside the timed loop, so the benchmark
+    # measures the endpoint rather than per-iteration request construction
+    import json
+    payload = json.dumps({'insight_text': 'Digital memory must be human-reachable.'})
+
+    # Warmup (also primes the insight hash cache)
+    response = client.post('/lift', data=payload, content_type='application/json')
+    assert response.status_code == 200
+
+    start = time.perf_counter()
+    for _ in range(100):
+        response = client.post('/lift', data=payload, content_type='application/json')
+    elapsed = time.perf_counter() - start
+
+    print(f"\n100 lift requests: {elapsed:.4f}s ({elapsed * 10:.2f}ms each)")
+
+    assert response.status_code == 200
+    assert elapsed < 5.0, "Repeated lift requests should complete quickly"
+
+
 def test_data_generation_performance():
     """Test that optimized data generation is more memory efficient."""
     from quasimoto_extended_benchmark import generate_4d_data